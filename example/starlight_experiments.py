@@ -98,25 +98,24 @@ if __name__ == "__main__":
     wait_times = []
     throughputs = []
     for node in routers:
-        initiator = node.name
         reserves = node.app.reserves
         _wait_times = node.app.get_wait_time()
         _throughputs = node.app.get_all_throughput()
         min_size = min(len(reserves), len(_wait_times), len(_throughputs))
-        reserves = reserves[:min_size]
-        _wait_times = _wait_times[:min_size]
-        _throughputs = _throughputs[:min_size]
-        for reservation, wait_time, throughput in zip(reserves, _wait_times,
-                                                      _throughputs):
-            responder, s_t, e_t, size, fidelity = reservation
-            initiators.append(initiator)
-            responders.append(responder)
-            start_times.append(s_t)
-            end_times.append(e_t)
-            memory_sizes.append(size)
-            fidelities.append(fidelity)
-            wait_times.append(wait_time)
-            throughputs.append(throughput)
+        if min_size == 0:
+            continue
+
+        # transpose reservation records into columns and extend in bulk
+        _responders, _start_times, _end_times, _memory_sizes, _fidelities = \
+            zip(*reserves[:min_size])
+        initiators.extend([node.name] * min_size)
+        responders.extend(_responders)
+        start_times.extend(_start_times)
+        end_times.extend(_end_times)
+        memory_sizes.extend(_memory_sizes)
+        fidelities.extend(_fidelities)
+        wait_times.extend(_wait_times[:min_size])
+        throughputs.extend(_throughputs[:min_size])
     log = {"Initiator": initiators, "Responder": responders,
            "Start_time": start_times, "End_time": end_times,
            "Memory_size": memory_sizes, "Fidelity": fidelities,
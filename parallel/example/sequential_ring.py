@@ -1,6 +1,6 @@
+import csv
 from json import dump
 import os
-import pandas as pd
 from time import time
 
 from sequence.kernel.timeline import Timeline
@@ -13,8 +13,7 @@ import sequence.utils.log as log
 def ring_network(ring_size: int, lookahead: int, stop_time: int,
                  log_path: str):
     tick = time()
-    if not os.path.exists(log_path):
-        os.mkdir(log_path)
+    os.makedirs(log_path, exist_ok=True)
 
     CC_DELAY = 1e9
     MEMO_SIZE = 50
@@ -29,12 +28,13 @@ def ring_network(ring_size: int, lookahead: int, stop_time: int,
     # log.track_module('generation')
     # log.track_module('bsm')
 
+    router_names = ["Node_%d" % i for i in range(ring_size)]
+    bsm_names = ["BSM_%d" % i for i in range(ring_size)]
+
     routers = []
     bsm_nodes = []
-    router_names = []
     for node_id in range(ring_size):
-        node_name = "Node_%d" % node_id
-        router_names.append(node_name)
+        node_name = router_names[node_id]
 
         node = QuantumRouter(node_name, tl, MEMO_SIZE)
         node.set_seed(node_id)
@@ -43,75 +43,67 @@ def ring_network(ring_size: int, lookahead: int, stop_time: int,
         routers.append(node)
 
     for bsm_id in range(ring_size):
-        node_name = "BSM_%d" % bsm_id
-        pre_node_name = 'Node_%d' % ((bsm_id - 1) % ring_size)
-        post_node_name = 'Node_%d' % bsm_id
+        node_name = bsm_names[bsm_id]
+        pre_node_name = router_names[(bsm_id - 1) % ring_size]
+        post_node_name = router_names[bsm_id]
 
         node = BSMNode(node_name, tl, [pre_node_name, post_node_name])
         node.set_seed(ring_size + bsm_id)
         bsm_nodes.append(node)
 
+    # every node connects to every other node (router or BSM) with a classical channel
+    dst_names = [name for pair in zip(router_names, bsm_names) for name in pair]
     for src in routers + bsm_nodes:
-        for dst_index in range(ring_size):
-            dst_name = "Node_%d" % dst_index
+        cc_prefix = "cc_%s_" % src.name
+        for dst_name in dst_names:
             if dst_name != src.name:
-                cc = ClassicalChannel("cc_%s_%s" % (src.name, dst_name),
-                                      tl, 20000, CC_DELAY)
+                cc = ClassicalChannel(cc_prefix + dst_name, tl, 20000, CC_DELAY)
                 cc.set_ends(src, dst_name)
 
-            dst_name = "BSM_%d" % dst_index
-            if dst_name != src.name:
-                cc = ClassicalChannel("cc_%s_%s" % (src.name, dst_name),
-                                      tl, 20000, CC_DELAY)
-                cc.set_ends(src, dst_name)
-
-    for src in routers:
-        bsm_index = int(src.name.replace("Node_", ""))
-        bsm_name = "BSM_%d" % bsm_index
+    # routers[i] is Node_i, so list positions double as node indices
+    for bsm_index, src in enumerate(routers):
+        bsm_name = bsm_names[bsm_index]
         qc = QuantumChannel("qc_%s_%s" % (src.name, bsm_name),
                             tl, ATTENUATION, lookahead * 2e-4)
         qc.set_ends(src, bsm_name)
-        router_name = "Node_%d" % ((bsm_index - 1) % ring_size)
+        router_name = router_names[(bsm_index - 1) % ring_size]
         src.add_bsm_node(bsm_name, router_name)
 
-        bsm_name = "BSM_%d" % ((bsm_index + 1) % ring_size)
+        bsm_name = bsm_names[(bsm_index + 1) % ring_size]
         qc = QuantumChannel("qc_%s_%s" % (src.name, bsm_name),
                             tl, ATTENUATION, lookahead * 2e-4)
         qc.set_ends(src, bsm_name)
-        router_name = "Node_%d" % ((bsm_index + 1) % ring_size)
+        router_name = router_names[(bsm_index + 1) % ring_size]
         src.add_bsm_node(bsm_name, router_name)
 
-    for node in routers:
-        node_index = int(node.name.replace("Node_", ""))
-        for dst in router_names:
-            if node.name != dst:
-                dst_index = int(dst.replace("Node_", ""))
-                if abs(node_index - dst_index) < ring_size - abs(
-                        node_index - dst_index):
-                    if dst_index > node_index:
-                        bsm_name = "Node_%d" % ((node_index + 1) % ring_size)
-                    else:
-                        bsm_name = "Node_%d" % ((node_index - 1) % ring_size)
-                else:
-                    if dst_index > node_index:
-                        bsm_name = "Node_%d" % ((node_index - 1) % ring_size)
-                    else:
-                        bsm_name = "Node_%d" % ((node_index + 1) % ring_size)
-
-                node.network_manager.protocol_stack[0].add_forwarding_rule(dst,
-                                                                           bsm_name)
+    # route to the neighbor on the shorter side of the ring; for the
+    # opposite node (even ring), go backward if dst_index > node_index
+    next_names = [router_names[(i + 1) % ring_size] for i in range(ring_size)]
+    prev_names = [router_names[(i - 1) % ring_size] for i in range(ring_size)]
+    for node_index, node in enumerate(routers):
+        routing_protocol = node.network_manager.protocol_stack[0]
+        for dst_index, dst in enumerate(router_names):
+            if dst_index == node_index:
+                continue
+            forward_dist = (dst_index - node_index) % ring_size
+            backward_dist = ring_size - forward_dist
+            if forward_dist < backward_dist or \
+                    (forward_dist == backward_dist and dst_index < node_index):
+                next_name = next_names[node_index]
+            else:
+                next_name = prev_names[node_index]
+            routing_protocol.add_forwarding_rule(dst, next_name)
 
     for node in routers:
         node.network_manager.protocol_stack[1].set_swapping_degradation(
             SWAP_DEG_RATE)
 
     apps = []
-    for i, node in enumerate(routers):
-        index = int(node.name.replace("Node_", ""))
+    for index, node in enumerate(routers):
         app = RequestApp(node)
         if index % 2 == 1:
             apps.append(app)
-            responder = "Node_%d" % ((index + 2) % ring_size)
+            responder = router_names[(index + 2) % ring_size]
             app.start(responder, 10e12, 11e12, MEMO_SIZE // 2, 0.82)
 
     tl.init()
@@ -134,35 +126,19 @@ def ring_network(ring_size: int, lookahead: int, stop_time: int,
                 "execution_time": execution_time,
                 "prepare_time": prepare_time}
     with open(log_path + '/net_info.json', 'w') as fh:
-        dump(net_info, fh)
-
-    # write reservation information into log_path/traffic_RANK.csv file
-    initiators = []
-    responders = []
-    start_times = []
-    end_times = []
-    memory_sizes = []
-    fidelities = []
-    paths = []
-    throughputs = []
-
-    for app in apps:
-        initiators.append(app.node.name)
-        responders.append(app.responder)
-        start_times.append(app.start_t)
-        end_times.append(app.end_t)
-        memory_sizes.append(app.memo_size)
-        fidelities.append(app.fidelity)
-        paths.append(app.path)
-        throughputs.append(app.get_throughput())
-
-    traffic_info = {"Initiator": initiators, "Responder": responders,
-                    "Start_time": start_times, "End_time": end_times,
-                    "Memory_size": memory_sizes, "Fidelity": fidelities,
-                    "Path": paths, "Throughput": throughputs}
-
-    df = pd.DataFrame(traffic_info)
-    df.to_csv(log_path + "/traffic.csv")
+        dump(net_info, fh, separators=(',', ':'))
+
+    # write reservation information into log_path/traffic.csv file
+    # (keep the leading unnamed index column for compatibility with earlier output)
+    header = ["", "Initiator", "Responder", "Start_time", "End_time",
+              "Memory_size", "Fidelity", "Path", "Throughput"]
+    with open(log_path + "/traffic.csv", 'w', newline='') as fh:
+        writer = csv.writer(fh, lineterminator="\n")
+        writer.writerow(header)
+        writer.writerows((i, app.node.name, app.responder, app.start_t,
+                          app.end_t, app.memo_size, app.fidelity, app.path,
+                          app.get_throughput())
+                         for i, app in enumerate(apps))
 
     perf_info = {'prepare_time': prepare_time,
                  'execution_time': execution_time,
@@ -170,7 +146,7 @@ def ring_network(ring_size: int, lookahead: int, stop_time: int,
                  'schedule_counter': tl.schedule_counter}
 
     with open('%s/perf.json' % (log_path), 'w') as fh:
-        dump(perf_info, fh)
+        dump(perf_info, fh, separators=(',', ':'))
 
 
 if __name__ == "__main__":
@@ -5,13 +5,14 @@ Also defined is a function to automatically construct a BSM of a specified type.
 """
 
 from abc import abstractmethod
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, List
 
 if TYPE_CHECKING:
     from ..kernel.quantum_manager import QuantumManager
     from ..kernel.quantum_state import State
 
-from numpy import outer, add, zeros, array_equal
+from numpy import outer, array, einsum, array_equal, ndarray
 
 from .circuit import Circuit
 from .detector import Detector
@@ -59,17 +60,37 @@ def _set_state_with_fidelity(keys: List[int], desired_state: List[complex], fide
         qm.set(keys, possible_states[state_ind])
 
     elif qm.formalism == DENSITY_MATRIX_FORMALISM:
-        multipliers = [(1 - fidelity) / 3] * 4
-        multipliers[possible_states.index(desired_state)] = fidelity
-        state = zeros((4, 4))
-        for mult, pure in zip(multipliers, possible_states):
-            state = add(state, mult * outer(pure, pure))
+        # perfect fidelity gives a pure state; skip the mixture
+        if fidelity == 1:
+            _set_pure_state(keys, desired_state, qm)
+            return
+
+        state = _bell_diagonal_state(possible_states.index(desired_state), fidelity)
         qm.set(keys, state)
 
     else:
         raise Exception("Invalid quantum manager with formalism {}".format(qm.formalism))
 
 
+@lru_cache(maxsize=64)
+def _bell_diagonal_state(desired_index: int, fidelity: float) -> ndarray:
+    """Function to build (and cache) a bell diagonal density matrix.
+
+    Args:
+        desired_index (int): index of the desired bell state in `BSM._bell_projectors`.
+        fidelity (float): weight of the desired bell state; the remaining weight is split evenly among the others.
+
+    Returns:
+        ndarray: read-only 4x4 density matrix.
+    """
+
+    multipliers = [(1 - fidelity) / 3] * 4
+    multipliers[desired_index] = fidelity
+    state = einsum('i,ijk->jk', multipliers, BSM._bell_projectors)
+    state.flags.writeable = False
+    return state
+
+
 def _set_pure_state(keys: List[int], ket_state: List[complex], qm: "QuantumManager"):
     if qm.formalism == KET_STATE_FORMALISM:
         qm.set(keys, ket_state)
@@ -109,6 +130,9 @@ class BSM(Entity):
     _phi_minus = [complex(sqrt(1 / 2)), complex(0), complex(0), -complex(sqrt(1 / 2))]
     _psi_plus = [complex(0), complex(sqrt(1 / 2)), complex(sqrt(1 / 2)), complex(0)]
     _psi_minus = [complex(0), complex(sqrt(1 / 2)), -complex(sqrt(1 / 2)), complex(0)]
+    # projectors onto the four bell states above (in the same order), stacked for bell diagonal states
+    _bell_projectors = array([outer(_phi_plus, _phi_plus), outer(_phi_minus, _phi_minus),
+                              outer(_psi_plus, _psi_plus), outer(_psi_minus, _psi_minus)])
 
     def __init__(self, name, timeline, phase_error=0, detectors=None):
         """Constructor for base BSM object.
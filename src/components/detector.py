@@ -6,8 +6,9 @@ QSDetector is defined as an abstract template and as implementations for polariz
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List
-from numpy import eye, kron, exp, sqrt
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from numpy import eye, kron, exp, sqrt, ndarray
 from scipy.linalg import fractional_matrix_power
 from math import factorial
 
@@ -22,6 +23,7 @@ from .circuit import Circuit
 from ..kernel.entity import Entity
 from ..kernel.event import Event
 from ..kernel.process import Process
+from ..kernel.quantum_utils import build_ladder_operators
 from ..utils.encoding import time_bin
 
 
@@ -308,6 +310,34 @@ class QSDetectorTimeBin(QSDetector):
         self.interferometer.__setattr__(arg_name, value)
 
 
+@lru_cache(maxsize=16)
+def _click_povms(truncation: int, efficiency: float) -> Tuple[ndarray, ndarray]:
+    """Function to generate POVM operators of a single detector having 0 and 1 click.
+
+    The operators only depend on the Fock space truncation and detector efficiency,
+    so they are built once and shared (as read-only arrays) between detectors with the same parameters.
+
+    Args:
+        truncation (int): Fock space truncation of the quantum manager.
+        efficiency (float): efficiency of the detector.
+
+    Returns:
+        Tuple[ndarray, ndarray]: POVM operators for no click and click, respectively.
+    """
+
+    create, destroy = build_ladder_operators(truncation)
+    create = create * sqrt(efficiency)
+    destroy = destroy * sqrt(efficiency)
+    series_elem_list = [((-1) ** i) * fractional_matrix_power(create, i + 1).dot(
+        fractional_matrix_power(destroy, i + 1)) / factorial(i + 1) for i in range(truncation)]
+    povm_click = sum(series_elem_list)
+    povm_no_click = eye(truncation + 1) - povm_click
+
+    povm_no_click.flags.writeable = False
+    povm_click.flags.writeable = False
+    return povm_no_click, povm_click
+
+
 class QSDetectorFockDirect(QSDetector):
     """QSDetector to directly measure photons in Fock state.
 
@@ -348,21 +378,8 @@ class QSDetectorFockDirect(QSDetector):
 
         # assume using Fock quantum manager
         truncation = self.timeline.quantum_manager.truncation
-        create, destroy = self.timeline.quantum_manager.build_ladder()
-
-        create0 = create * sqrt(self.detectors[0].efficiency)
-        destroy0 = destroy * sqrt(self.detectors[0].efficiency)
-        series_elem_list = [((-1)**i) * fractional_matrix_power(create0, i+1).dot(
-            fractional_matrix_power(destroy0, i+1)) / factorial(i+1) for i in range(truncation)]
-        povm0_1 = sum(series_elem_list)
-        povm0_0 = eye(truncation+1) - povm0_1
-
-        create1 = create * sqrt(self.detectors[1].efficiency)
-        destroy1 = destroy * sqrt(self.detectors[1].efficiency)
-        series_elem_list = [((-1) ** i) * fractional_matrix_power(create1, i + 1).dot(
-            fractional_matrix_power(destroy1, i + 1)) / factorial(i + 1) for i in range(truncation)]
-        povm1_1 = sum(series_elem_list)
-        povm1_0 = eye(truncation + 1) - povm0_1
+        povm0_0, povm0_1 = _click_povms(truncation, self.detectors[0].efficiency)
+        povm1_0, povm1_1 = _click_povms(truncation, self.detectors[1].efficiency)
 
         self.povms = [povm0_0, povm0_1, povm1_0, povm1_1]
 
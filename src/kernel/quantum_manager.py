@@ -15,10 +15,8 @@ if TYPE_CHECKING:
     from ..components.circuit import Circuit
     from .quantum_state import State
 
-from qutip.qip.circuit import QubitCircuit, Gate
-from qutip.qip.operations import gate_sequence_product
 from numpy import log, array, cumsum, base_repr, zeros
-from scipy.sparse import csr_matrix
+from scipy.sparse import csr_matrix, identity as sparse_identity, kron as sparse_kron
 from scipy.special import binom
 
 from .quantum_state import KetState, DensityState
@@ -119,14 +117,14 @@ class QuantumManager:
         return new_state, all_keys, circ_mat
 
     def _swap_qubits(self, all_keys, keys):
-        swap_circuit = QubitCircuit(N=len(all_keys))
+        # track which original qubit ends up at each position
+        order = list(range(len(all_keys)))
         for i, key in enumerate(keys):
             j = all_keys.index(key)
             if j != i:
-                gate = Gate("SWAP", targets=[i, j])
-                swap_circuit.add_gate(gate)
                 all_keys[i], all_keys[j] = all_keys[j], all_keys[i]
-        swap_mat = gate_sequence_product(swap_circuit.propagators()).full()
+                order[i], order[j] = order[j], order[i]
+        swap_mat = qubit_permutation_with_cache(tuple(order))
         return all_keys, swap_mat
 
     @abstractmethod
@@ -256,10 +254,11 @@ class QuantumManagerKet(QuantumManager):
                 tuple(state), len(keys), len_diff)
 
             # choose result, set as new state
-            for i in range(int(2 ** len(keys))):
-                if meas_samp < sum(probabilities[:i + 1]):
+            prob_sum = cumsum(probabilities)
+            for i, (output_state, p) in enumerate(zip(new_states, prob_sum)):
+                if meas_samp < p:
                     result = i
-                    new_state = new_states[i]
+                    new_state = output_state
                     break
 
             for key in keys:
@@ -390,10 +389,11 @@ class QuantumManagerDensity(QuantumManager):
                 state_to_measure, len(keys), len_diff)
 
             # choose result, set as new state
-            for i in range(int(2 ** len(keys))):
-                if meas_samp < sum(probabilities[:i + 1]):
+            prob_sum = cumsum(probabilities)
+            for i, (output_state, p) in enumerate(zip(new_states, prob_sum)):
+                if meas_samp < p:
                     result = i
-                    new_state = new_states[i]
+                    new_state = output_state
                     break
 
         result_digits = [int(x) for x in bin(result)[2:]]
@@ -448,18 +448,20 @@ class QuantumManagerDensityFock(QuantumManager):
             j (int): index of second subsystem to swap
 
         Returns:
-            Array[int]: unitary swapping operator
+            csr_matrix: unitary swapping operator (sparse, with a single nonzero element per row).
         """
 
         size = self.dim ** num_systems
-        swap_unitary = zeros((size, size))
+        new_indices = [0] * size
 
         for old_index in range(size):
             old_str = base_repr(old_index, self.dim)
             old_str = old_str.zfill(num_systems)
             new_str = ''.join((old_str[:i], old_str[j], old_str[i+1:j], old_str[i], old_str[j+1:]))
-            new_index = int(new_str, base=self.dim)
-            swap_unitary[new_index, old_index] = 1
+            new_indices[old_index] = int(new_str, base=self.dim)
+
+        data = [1] * size
+        swap_unitary = csr_matrix((data, (new_indices, range(size))), shape=(size, size))
 
         return swap_unitary
 
@@ -501,14 +503,19 @@ class QuantumManagerDensityFock(QuantumManager):
             if start_idx + len(keys) > len(all_keys):
                 start_idx = len(all_keys) - len(keys)
 
+            # fuse all swaps into a single permutation before touching the state
+            swap_unitary = None
             for i, key in enumerate(keys):
                 i = i + start_idx
                 j = all_keys.index(key)
                 if j != i:
-                    swap_unitary = self._generate_swap_operator(len(all_keys), i, j)
-                    new_state = swap_unitary @ new_state @ swap_unitary.T
+                    swap = self._generate_swap_operator(len(all_keys), i, j)
+                    swap_unitary = swap if swap_unitary is None else swap @ swap_unitary
                     all_keys[i], all_keys[j] = all_keys[j], all_keys[i]
 
+            if swap_unitary is not None:
+                new_state = swap_unitary @ new_state @ swap_unitary.T
+
         return new_state, all_keys
 
     def _prepare_operator(self, all_keys: List[int], keys: List[int], operator) -> array:
@@ -554,14 +561,7 @@ class QuantumManagerDensityFock(QuantumManager):
 
     def build_ladder(self):
         """Generate matrix of creation and annihilation (ladder) operators on truncated Hilbert space."""
-        truncation = self.truncation
-        data = array([sqrt(i+1) for i in range(truncation)])  # elements in create/annihilation operator matrix
-        row = array([i+1 for i in range(truncation)])
-        col = array([i for i in range(truncation)])
-        create = csr_matrix((data, (row, col)), shape=(truncation+1, truncation+1)).toarray()
-        destroy = create.conj().T
-
-        return create, destroy
+        return build_ladder_operators(self.truncation)
 
     def measure(self, keys: List[int], povms: List[array], meas_samp: float) -> int:
         """Method to measure subsystems at given keys in POVM formalism.
@@ -656,10 +656,11 @@ class QuantumManagerDensityFock(QuantumManager):
 
         return result
 
-    def _build_loss_kraus_operators(self, loss_rate: float, all_keys: List[int], key: int) -> List[array]:
+    def _build_loss_kraus_operators(self, loss_rate: float, all_keys: List[int], key: int) -> List[csr_matrix]:
         """Method to build Kraus operators of a generalized amplitude damping channel.
 
         This represents the effect of photon loss.
+        Operators are sparse, as each is padded from the lossy subsystem with identities.
 
         Args:
             loss_rate (float): loss rate for the quantum channel.
@@ -667,22 +668,24 @@ class QuantumManagerDensityFock(QuantumManager):
             key (int): key for subsystem experiencing loss.
 
         Returns:
-            List[array]: list of generated Kraus operators.
+            List[csr_matrix]: list of generated Kraus operators.
         """
 
         assert 0 <= loss_rate <= 1
         kraus_ops = []
 
-        for k in range(self.dim):
-            total_kraus_op = zeros((self.dim ** len(all_keys), self.dim ** len(all_keys)))
-
-            for n in range(k, self.dim):
-                coeff = sqrt(binom(n, k)) * sqrt(((1-loss_rate) ** (n-k)) * (loss_rate ** k))
-                single_op = zeros((self.dim, self.dim))
-                single_op[n-k, n] = 1
-                total_op = self._prepare_operator(all_keys, [key], single_op)
-                total_kraus_op += coeff * total_op
+        left_id = sparse_identity(self.dim ** all_keys.index(key), format="csr")
+        right_id = sparse_identity(self.dim ** (len(all_keys) - all_keys.index(key) - 1), format="csr")
 
+        for k in range(self.dim):
+            # operator on the lossy subsystem: maps |n> to |n-k> for each n >= k
+            coeffs = [sqrt(binom(n, k)) * sqrt(((1-loss_rate) ** (n-k)) * (loss_rate ** k))
+                      for n in range(k, self.dim)]
+            rows = [n - k for n in range(k, self.dim)]
+            cols = [n for n in range(k, self.dim)]
+            single_op = csr_matrix((coeffs, (rows, cols)), shape=(self.dim, self.dim))
+
+            total_kraus_op = sparse_kron(sparse_kron(left_id, single_op), right_id, format="csr")
             kraus_ops.append(total_kraus_op)
 
         return kraus_ops
@@ -695,6 +698,10 @@ class QuantumManagerDensityFock(QuantumManager):
             loss_rate (float): loss rate for the quantum channel.
         """
 
+        # lossless channel leaves the state unchanged
+        if loss_rate == 0:
+            return
+
         prepared_state, all_keys = self._prepare_state([key])
         kraus_ops = self._build_loss_kraus_operators(loss_rate, all_keys, key)
         output_state = zeros(prepared_state.shape, dtype=complex)
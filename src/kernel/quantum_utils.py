@@ -10,6 +10,7 @@ from math import sqrt
 
 from numpy import array, kron, identity, zeros, trace, outer, eye
 from scipy.linalg import sqrtm
+from scipy.sparse import csr_matrix
 
 
 a = array([[0, 1], [0, 0]])
@@ -19,6 +20,135 @@ povm_0 = (1/2) * (kron(a_dag @ a, eye(2)) - 1j*kron(a, a_dag) + 1j*kron(a_dag, a
 povm_1 = (1/2) * (kron(a_dag @ a, eye(2)) + 1j*kron(a, a_dag) - 1j*kron(a_dag, a) + kron(eye(2), a_dag @ a))
 
 
+def build_ladder_operators(truncation: int) -> Tuple[array, array]:
+    """Generates matrices of creation and annihilation (ladder) operators on truncated Hilbert space.
+
+    Args:
+        truncation (int): fock space truncation (maximum number of excitations).
+
+    Returns:
+        Tuple[array, array]: creation and annihilation operators, respectively.
+    """
+
+    data = array([sqrt(i+1) for i in range(truncation)])  # elements in create/annihilation operator matrix
+    row = array([i+1 for i in range(truncation)])
+    col = array([i for i in range(truncation)])
+    create = csr_matrix((data, (row, col)), shape=(truncation+1, truncation+1)).toarray()
+    destroy = create.conj().T
+
+    return create, destroy
+
+
+@lru_cache(maxsize=1000)
+def _entangled_projectors_ket(state_index: int, num_states: int) -> Tuple[array, array]:
+    """Builds (and caches) the single-qubit projectors padded to the full ket space.
+
+    The projectors only depend on the position of the measured qubit, so they are shared between calls.
+    """
+
+    projector0 = [1]
+    projector1 = [1]
+    for i in range(num_states):
+        if i == state_index:
+            projector0 = kron(projector0, [1, 0])
+            projector1 = kron(projector1, [0, 1])
+        else:
+            projector0 = kron(projector0, identity(2))
+            projector1 = kron(projector1, identity(2))
+
+    # cached arrays are shared between callers
+    projector0.flags.writeable = False
+    projector1.flags.writeable = False
+    return projector0, projector1
+
+
+@lru_cache(maxsize=1000)
+def _entangled_projectors_density(state_index: int, num_states: int) -> Tuple[array, array]:
+    """Builds (and caches) the single-qubit projectors padded to the full density matrix space."""
+
+    projector0 = [1]
+    projector1 = [1]
+    for i in range(num_states):
+        if i == state_index:
+            projector0 = kron(projector0, [[1, 0], [0, 0]])
+            projector1 = kron(projector1, [[0, 0], [0, 1]])
+        else:
+            projector0 = kron(projector0, identity(2))
+            projector1 = kron(projector1, identity(2))
+
+    # cached arrays are shared between callers
+    projector0.flags.writeable = False
+    projector1.flags.writeable = False
+    return projector0, projector1
+
+
+@lru_cache(maxsize=1000)
+def _multiple_projectors_ket(num_states: int, length_diff: int) -> Tuple[array, ...]:
+    """Builds (and caches) the computational basis projectors acting on a ket,
+    for measuring the leading `num_states` qubits.
+
+    Each projector is a row operator `<i| x I`, mapping the full ket space onto the unmeasured qubits.
+    """
+
+    basis_count = 2 ** num_states
+    projectors = [None] * basis_count
+    for i in range(basis_count):
+        M = zeros((1, basis_count), dtype=complex)  # measurement operator
+        M[0, i] = 1
+        projectors[i] = kron(M, identity(2 ** length_diff))  # projector
+        projectors[i].flags.writeable = False
+
+    return tuple(projectors)
+
+
+@lru_cache(maxsize=1000)
+def _multiple_projectors_density(num_states: int, length_diff: int) -> Tuple[array, ...]:
+    """Builds (and caches) the computational basis projectors acting on a density matrix,
+    for measuring the leading `num_states` qubits.
+
+    Each projector is a square operator `|i><i| x I` on the full density matrix space.
+    """
+
+    basis_count = 2 ** num_states
+    projectors = [None] * basis_count
+    for i in range(basis_count):
+        M = zeros((basis_count, basis_count), dtype=complex)  # measurement operator
+        M[i, i] = 1
+        projectors[i] = kron(M, identity(2 ** length_diff))  # projector
+        projectors[i].flags.writeable = False
+
+    return tuple(projectors)
+
+
+@lru_cache(maxsize=1000)
+def _pad_povms(povms: Tuple[Tuple[Tuple[complex]]], left_dim: int, right_dim: int) -> Tuple[array, ...]:
+    """Builds (and caches) POVM operators on the total Hilbert space by padding with identities."""
+
+    padded = [kron(kron(identity(left_dim), array(povm)), identity(right_dim)) for povm in povms]
+    for povm in padded:
+        povm.flags.writeable = False
+    return tuple(padded)
+
+
+@lru_cache(maxsize=1000)
+def qubit_permutation_with_cache(order: Tuple[int]) -> array:
+    """Generates the unitary reordering qubits of a state.
+
+    Args:
+        order (Tuple[int]): new order of qubits, where `order[i]` is the original index of the qubit moved to index i.
+
+    Returns:
+        array: permutation matrix `P`, such that `P @ state` has its qubits in the given order.
+    """
+
+    num_qubits = len(order)
+    size = 2 ** num_qubits
+    perm = identity(size).reshape((2,) * num_qubits + (size,))
+    perm = perm.transpose(order + (num_qubits,)).reshape((size, size))
+    perm.flags.writeable = False  # cached array is shared between callers
+    return perm
+
+
 @lru_cache(maxsize=1000)
 def measure_state_with_cache(state: Tuple[complex, complex], basis: Tuple[Tuple[complex]]) -> float:
 
@@ -27,8 +157,9 @@ def measure_state_with_cache(state: Tuple[complex, complex], basis: Tuple[Tuple[
     # measurement operator
     M0 = outer(u.conj(), u)
 
-    # probability of measuring basis[0]
-    prob_0 = (state.conj().transpose() @ M0.conj().transpose() @ M0 @ state).real
+    # probability of measuring basis[0] (squared norm of projected state)
+    projected = M0 @ state
+    prob_0 = (projected.conj() @ projected).real
     return prob_0
 
 
@@ -55,8 +186,9 @@ def measure_entangled_state_with_cache(state: Tuple[complex], basis: Tuple[Tuple
             projector0 = kron(projector0, identity(2))
             projector1 = kron(projector1, identity(2))
 
-    # probability of measuring basis[0]
-    prob_0 = (state.conj().transpose() @ projector0.conj().transpose() @ projector0 @ state).real
+    # probability of measuring basis[0] (squared norm of projected state)
+    projected0 = projector0 @ state
+    prob_0 = (projected0.conj() @ projected0).real
 
     if prob_0 >= 1:
         state1 = None
@@ -66,7 +198,7 @@ def measure_entangled_state_with_cache(state: Tuple[complex], basis: Tuple[Tuple
     if prob_0 <= 0:
         state0 = None
     else:
-        state0 = (projector0 @ state) / sqrt(prob_0)
+        state0 = projected0 / sqrt(prob_0)
 
     return state0, state1, prob_0
 
@@ -77,21 +209,21 @@ def measure_multiple_with_cache(state: Tuple[complex], basis: Tuple[Tuple[comple
 
     state = array(state)
     # construct measurement operators, projectors, and probabilities of measurement
-    projectors = [None] * len(basis)
+    projected = [None] * len(basis)
     probabilities = [0] * len(basis)
     for i, vector in enumerate(basis):
         vector = array(vector, dtype=complex)
         M = outer(vector.conj(), vector)  # measurement operator
-        projectors[i] = kron(M, identity(2 ** length_diff))  # projector
-        probabilities[i] = (state.conj().transpose() @ projectors[i].conj().transpose() @ projectors[i] @ state).real
+        projected[i] = kron(M, identity(2 ** length_diff)) @ state  # projected state
+        probabilities[i] = (projected[i].conj() @ projected[i]).real
         if probabilities[i] < 0:
             probabilities[i] = 0
 
-    return_states = [None] * len(projectors)
-    for i, proj in enumerate(projectors):
-        # project to new state
+    return_states = [None] * len(projected)
+    for i, proj_state in enumerate(projected):
+        # normalize projected state
         if probabilities[i] > 0:
-            new_state = (proj @ state) / sqrt(probabilities[i])
+            new_state = proj_state / sqrt(probabilities[i])
             return_states[i] = new_state
 
     return return_states, probabilities
@@ -113,20 +245,11 @@ def measure_entangled_state_with_cache_ket(state: Tuple[complex], state_index: i
         -> Tuple[array, array, float]:
 
     state = array(state)
+    projector0, projector1 = _entangled_projectors_ket(state_index, num_states)
 
-    # generate projectors
-    projector0 = [1]
-    projector1 = [1]
-    for i in range(num_states):
-        if i == state_index:
-            projector0 = kron(projector0, [1, 0])
-            projector1 = kron(projector1, [0, 1])
-        else:
-            projector0 = kron(projector0, identity(2))
-            projector1 = kron(projector1, identity(2))
-
-    # probability of measuring basis[0]
-    prob_0 = (state.conj().T @ projector0.T @ projector0 @ state).real
+    # probability of measuring basis[0] (squared norm of projected state)
+    projected0 = projector0 @ state
+    prob_0 = (projected0.conj() @ projected0).real
 
     if prob_0 >= 1:
         state1 = None
@@ -136,7 +259,7 @@ def measure_entangled_state_with_cache_ket(state: Tuple[complex], state_index: i
     if prob_0 <= 0:
         state0 = None
     else:
-        state0 = (projector0 @ state) / sqrt(prob_0)
+        state0 = projected0 / sqrt(prob_0)
 
     return state0, state1, prob_0
 
@@ -148,24 +271,22 @@ def measure_multiple_with_cache_ket(state: Tuple[complex], num_states: int, leng
     state = array(state)
     basis_count = 2 ** num_states
 
-    # construct measurement operators, projectors, and probabilities of measurement
-    projectors = [None] * basis_count
+    # get projectors and calculate probabilities of measurement
+    projectors = _multiple_projectors_ket(num_states, length_diff)
+    projected = [proj @ state for proj in projectors]
     probabilities = [0] * basis_count
     for i in range(basis_count):
-        M = zeros((1, basis_count), dtype=complex)  # measurement operator
-        M[0, i] = 1
-        projectors[i] = kron(M, identity(2 ** length_diff))  # projector
-        probabilities[i] = (state.conj().T @ projectors[i].T @ projectors[i] @ state).real
+        probabilities[i] = (projected[i].conj() @ projected[i]).real
         if probabilities[i] < 0:
             probabilities[i] = 0
         if probabilities[i] > 1:
             probabilities[i] = 1
 
-    return_states = [None] * len(projectors)
-    for i, proj in enumerate(projectors):
-        # project to new state
+    return_states = [None] * len(projected)
+    for i, proj_state in enumerate(projected):
+        # normalize projected state
         if probabilities[i] > 0:
-            new_state = (proj @ state) / sqrt(probabilities[i])
+            new_state = proj_state / sqrt(probabilities[i])
             new_state = tuple(new_state)
             return_states[i] = new_state
 
@@ -188,17 +309,7 @@ def measure_entangled_state_with_cache_density(state: Tuple[Tuple[complex]], sta
         -> Tuple[array, array, float]:
 
     state = array(state)
-
-    # generate projectors
-    projector0 = [1]
-    projector1 = [1]
-    for i in range(num_states):
-        if i == state_index:
-            projector0 = kron(projector0, [[1, 0], [0, 0]])
-            projector1 = kron(projector1, [[0, 0], [0, 1]])
-        else:
-            projector0 = kron(projector0, identity(2))
-            projector1 = kron(projector1, identity(2))
+    projector0, projector1 = _entangled_projectors_density(state_index, num_states)
 
     # probability of measuring basis[0]
     prob_0 = trace(state @ projector0).real
@@ -223,13 +334,10 @@ def measure_multiple_with_cache_density(state: Tuple[Tuple[complex]], num_states
     state = array(state)
     basis_count = 2 ** num_states
 
-    # construct measurement operators, projectors, and probabilities of measurement
-    projectors = [None] * basis_count
+    # get projectors and calculate probabilities of measurement
+    projectors = _multiple_projectors_density(num_states, length_diff)
     probabilities = [0] * basis_count
     for i in range(basis_count):
-        M = zeros((basis_count, basis_count), dtype=complex)  # measurement operator
-        M[i, i] = 1
-        projectors[i] = kron(M, identity(2 ** length_diff))  # projector
         probabilities[i] = trace(state @ projectors[i]).real
         if probabilities[i] < 0:
             probabilities[i] = 0
@@ -294,15 +402,11 @@ def measure_entangled_state_with_cache_fock_density(state: Tuple[Tuple[complex]]
     """
 
     state = array(state)
-    povms = [array(povm) for povm in povms]
 
     # generate POVM operators on total Hilbert space
-    povm_list = []
     left_dim = (truncation + 1) ** system_index
     right_dim = (truncation + 1) ** (num_systems - system_index - 1)
-    for povm in povms:
-        povm_tot = kron(kron(identity(left_dim), povm), identity(right_dim))
-        povm_list.append(povm_tot)
+    povm_list = _pad_povms(povms, left_dim, right_dim)
 
     # list of probabilities of getting different outcomes from POVM
     prob_list = [trace(state @ povm).real for povm in povm_list]
@@ -354,7 +458,6 @@ def measure_multiple_with_cache_fock_density(state: Tuple[Tuple[complex]], indic
     """
 
     state = array(state)
-    povms = [array(povm) for povm in povms]
 
     # judge if elements in `indices` are consecutive
     init_meas_sys_idx = min(indices)
@@ -363,12 +466,9 @@ def measure_multiple_with_cache_fock_density(state: Tuple[Tuple[complex]], indic
     if (fin_meas_sys_idx - init_meas_sys_idx + 1 != num) or (list(indices) != sorted(indices)):
         raise ValueError("Indices should be consecutive; got {}".format(indices))
 
-    povm_list = []
     left_dim = (truncation + 1) ** init_meas_sys_idx
     right_dim = (truncation + 1) ** (num_systems - fin_meas_sys_idx - 1)
-    for povm in povms:
-        povm_tot = kron(kron(identity(left_dim), povm), identity(right_dim))
-        povm_list.append(povm_tot)
+    povm_list = _pad_povms(povms, left_dim, right_dim)
 
     # list of probabilities of getting different outcomes from POVM
     prob_list = [trace(state @ povm).real for povm in povm_list]
@@ -404,13 +504,16 @@ def density_partial_trace(state: Tuple[Tuple[complex]], indices: Tuple[int], num
         array: output state with reduced number of subsystems `num_systems - len(indices)`.
     """
 
-    temp = array(state)
+    assert list(indices) == sorted(set(indices)), "indices must be unique and sorted in increasing order"
 
-    for i, idx in enumerate(indices):
-        offset = num_systems - i
-        temp = temp.reshape((truncation+1,) * offset * 2)
-        temp = trace(temp, axis1=(idx-i), axis2=(offset+idx-i))
+    dim = truncation + 1
+    kept = [i for i in range(num_systems) if i not in indices]
+    output_dim = dim ** len(kept)
+    traced_dim = dim ** len(indices)
 
-    output_dim = (truncation + 1) ** (num_systems - len(indices))
-    output_state = temp.reshape((output_dim, output_dim))
+    # group kept and traced subsystems (for both rows and columns), then trace all at once
+    axes = kept + list(indices) + [num_systems + i for i in kept] + [num_systems + i for i in indices]
+    temp = array(state).reshape((dim,) * num_systems * 2).transpose(axes)
+    temp = temp.reshape((output_dim, traced_dim, output_dim, traced_dim))
+    output_state = trace(temp, axis1=1, axis2=3)
     return output_state
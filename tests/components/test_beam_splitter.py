@@ -5,8 +5,8 @@ from sequence.components.photon import Photon
 from sequence.kernel.timeline import Timeline
 from sequence.utils.encoding import polarization
 
-np.random.seed(0)
 SEED = 0
+rng = np.random.default_rng(SEED)
 
 
 def test_BeamSplitter_init():
@@ -62,7 +62,7 @@ def test_BeamSplitter_get():
     for i in range(basis_len):
         time = 1e12 / frequency * i
         tl.time = time
-        bit = np.random.randint(2)
+        bit = rng.integers(2)
         bits.append(bit)
         photon = Photon(str(i), tl, quantum_state=polarization["bases"][0][bit])
         bs.get(photon)
@@ -85,7 +85,7 @@ def test_BeamSplitter_get():
     for i in range(basis_len):
         time = 1e12 / frequency * i
         tl.time = time
-        bit = np.random.randint(2)
+        bit = rng.integers(2)
         bits2.append(bit)
         photon = Photon(str(i), tl, quantum_state=polarization["bases"][1][bit])
         bs.get(photon)
@@ -108,7 +108,7 @@ def test_BeamSplitter_get():
     for i in range(basis_len):
         time = 1e12 / frequency * i
         tl.time = time
-        bit = np.random.randint(2)
+        bit = rng.integers(2)
         bits.append(bit)
         photon = Photon(str(i), tl, quantum_state=polarization["bases"][0][bit])
         bs.get(photon)
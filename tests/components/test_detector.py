@@ -232,6 +232,24 @@ def test_QSDetectorFockDirect():
     assert len(times[1]) == NUM_TRIALS
 
 
+def test_QSDetectorFockDirect_povms():
+    src_list = ["a", "b"]
+    efficiencies = [0.7, 0.4]
+
+    for truncation in range(1, 4):
+        tl = Timeline(formalism=FOCK_DENSITY_MATRIX_FORMALISM, truncation=truncation)
+        qsd = QSDetectorFockDirect("qsd", tl, src_list)
+        [qsd.update_detector_params(i, "efficiency", efficiencies[i]) for i in range(2)]
+        tl.init()
+
+        povms = qsd.povms
+        identity = np.eye(truncation + 1)
+        assert np.allclose(povms[0], identity - povms[1])
+        assert np.allclose(povms[2], identity - povms[3])
+        assert not np.allclose(povms[0], povms[2])
+        assert not np.allclose(povms[1], povms[3])
+
+
 def test_QSDetectorFockInterference():
     class RandomControl:
         def __init__(self, seed):
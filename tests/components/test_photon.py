@@ -4,18 +4,29 @@ import pytest
 from sequence.kernel.timeline import Timeline
 from sequence.components.photon import Photon
 
-rng = np.random.default_rng()
+rng = np.random.default_rng(0)
 
+# shared states and measurement bases
+# (kept as tuples, since the cached measurement functions hash their arguments)
+ZERO = (complex(1), complex(0))
+ONE = (complex(0), complex(1))
+BASIS_1Q = (ZERO, ONE)
+BASIS_2Q = tuple(tuple(complex(i == j) for j in range(4)) for i in range(4))
 
-def test_init():
-    tl = Timeline()
+
+@pytest.fixture(scope="module")
+def tl():
+    # photons here store their state locally, so one timeline can be shared
+    return Timeline()
+
+
+def test_init(tl):
     photon = Photon("", tl)
     
-    assert photon.quantum_state.state == (complex(1), complex(0))
+    assert photon.quantum_state.state == ZERO
 
 
-def test_combine_state():
-    tl = Timeline()
+def test_combine_state(tl):
     photon1 = Photon("p1", tl)
     photon2 = Photon("p2", tl)
     photon1.combine_state(photon2)
@@ -23,7 +34,7 @@ def test_combine_state():
     state1 = photon1.quantum_state
     state2 = photon2.quantum_state
 
-    test_state = (complex(1), complex(0), complex(0), complex(0))
+    test_state = BASIS_2Q[0]
     for i, coeff in enumerate(state1.state):
         assert coeff == state2.state[i]
         assert coeff == test_state[i]
@@ -31,11 +42,10 @@ def test_combine_state():
     assert state1.entangled_states == [state1, state2]
 
 
-def test_set_state():
-    tl = Timeline()
+def test_set_state(tl):
     photon = Photon("", tl)
 
-    test_state = (complex(0), complex(1))
+    test_state = ONE
     photon.set_state(test_state)
     for i, coeff in enumerate(photon.quantum_state.state):
         assert coeff == test_state[i]
@@ -50,37 +60,28 @@ def test_set_state():
         photon.set_state(test_state)
 
     # incorrect size
-    test_state = (complex(1), complex(0), complex(0), complex(0))
+    test_state = BASIS_2Q[0]
     with pytest.raises(AssertionError):
         photon.set_state(test_state)
 
 
-def test_measure():
-    tl = Timeline()
-    photon1 = Photon("p1", tl, quantum_state=(complex(1), complex(0)))
-    photon2 = Photon("p2", tl, quantum_state=(complex(0), complex(1)))
-    basis = ((complex(1), complex(0)), (complex(0), complex(1)))
+def test_measure(tl):
+    photon1 = Photon("p1", tl, quantum_state=ZERO)
+    photon2 = Photon("p2", tl, quantum_state=ONE)
 
-    assert Photon.measure(basis, photon1, rng) == 0
-    assert Photon.measure(basis, photon2, rng) == 1
+    assert Photon.measure(BASIS_1Q, photon1, rng) == 0
+    assert Photon.measure(BASIS_1Q, photon2, rng) == 1
 
 
-def test_measure_multiple():
-    tl = Timeline()
+def test_measure_multiple(tl):
     photon1 = Photon("p1", tl)
     photon2 = Photon("p2", tl)
     photon1.combine_state(photon2)
 
-    basis = ((complex(1), complex(0), complex(0), complex(0)),
-             (complex(0), complex(1), complex(0), complex(0)),
-             (complex(0), complex(0), complex(1), complex(0)),
-             (complex(0), complex(0), complex(0), complex(1)))
-
-    assert Photon.measure_multiple(basis, [photon1, photon2], rng) == 0
+    assert Photon.measure_multiple(BASIS_2Q, [photon1, photon2], rng) == 0
 
 
-def test_add_loss():
-    tl = Timeline()
+def test_add_loss(tl):
     photon = Photon("", tl, encoding_type={"name": "single_atom"})
     assert photon.loss == 0
 
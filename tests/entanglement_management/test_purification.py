@@ -8,7 +8,7 @@ from sequence.kernel.timeline import Timeline
 from sequence.entanglement_management.purification import *
 from sequence.topology.node import Node
 
-np.random.seed(0)
+rng = np.random.default_rng(0)
 
 ENTANGLED = 'ENTANGLED'
 RAW = 'RAW'
@@ -623,14 +623,14 @@ def get_random_state_by_fidelity(fidelity):
     def prob_distribution(f: float) -> List[float]:
         return [f, (1 - f) / 3, (1 - f) / 3, (1 - f) / 3]
 
-    choice = np.random.choice
+    choice = rng.choice
     index1, index2 = [choice(range(4), 1, p=prob_distribution(fidelity))[0] for _ in range(2)]
     return BELL_STATES[index1], BELL_STATES[index2]
 
 
 def test_BBPSSW_fidelity():
     for i in range(1000):
-        fidelity = np.random.uniform(0.5, 1)
+        fidelity = rng.uniform(0.5, 1)
         state1, state2 = get_random_state_by_fidelity(fidelity)
         tl, kept1, kept2, meas1, meas2, ep1, ep2 = create_scenario(state1, state2, i, fidelity)
         a1, a2 = [tl.get_entity_by_name(name) for name in ["a1", "a2"]]
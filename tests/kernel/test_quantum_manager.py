@@ -553,3 +553,45 @@ def test_qmanager_measure_fock():
             raise Exception()
 
     assert abs((len(meas_0) / NUM_TESTS) - 0.5) < 0.1
+
+
+def test_qmanager_add_loss_fock():
+    LOSS = 0.3
+
+    qm = QuantumManagerDensityFock(truncation=1)
+    # W state on three modes: (|100> + |010> + |001>) / sqrt(3)
+    w_state = np.array([0, 1, 1, 0, 1, 0, 0, 0]) / math.sqrt(3)
+    keys = [qm.new() for _ in range(3)]
+    qm.set(keys, np.outer(w_state, w_state))
+
+    # apply loss to the middle mode
+    qm.add_loss(keys[1], LOSS)
+
+    # amplitude damping Kraus operators on the middle mode
+    kraus_0 = np.array([[1, 0], [0, math.sqrt(1 - LOSS)]])
+    kraus_1 = np.array([[0, math.sqrt(LOSS)], [0, 0]])
+    desired = np.zeros((8, 8), dtype=complex)
+    for kraus in [kraus_0, kraus_1]:
+        op = np.kron(np.kron(np.eye(2), kraus), np.eye(2))
+        desired += op @ np.outer(w_state, w_state) @ op.conj().T
+
+    output_state, all_keys = qm._prepare_state(keys)
+    assert all_keys == keys
+    assert np.allclose(output_state, desired)
+    assert np.isclose(np.trace(output_state), 1)
+    # the lost photon leaves the other two modes in vacuum with probability LOSS / 3
+    assert np.isclose(output_state[0, 0], LOSS / 3)
+
+
+def test_qmanager_add_loss_fock_lossless():
+    qm = QuantumManagerDensityFock(truncation=1)
+    w_state = np.array([0, 1, 1, 0, 1, 0, 0, 0]) / math.sqrt(3)
+    keys = [qm.new() for _ in range(3)]
+    qm.set(keys, np.outer(w_state, w_state))
+    state_before = qm.get(keys[1])
+
+    qm.add_loss(keys[1], 0)
+
+    state_after = qm.get(keys[1])
+    assert state_after.keys == state_before.keys
+    assert np.array_equal(state_after.state, np.outer(w_state, w_state))
@@ -0,0 +1,53 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from sequence.kernel.quantum_utils import density_partial_trace
+
+
+rng = np.random.default_rng(0)
+
+
+def random_density(dim):
+    mat = rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim))
+    density = mat @ mat.conj().T
+    return density / np.trace(density)
+
+
+def reference_partial_trace(state, indices, num_systems, truncation):
+    # trace out subsystems one basis vector at a time: sum_k <k| state |k>
+    dim = truncation + 1
+    eye = np.eye(dim)
+    output_dim = dim ** (num_systems - len(indices))
+    output_state = np.zeros((output_dim, output_dim), dtype=complex)
+    for basis in product(range(dim), repeat=len(indices)):
+        bra = np.ones((1, 1))
+        traced = dict(zip(indices, basis))
+        for i in range(num_systems):
+            factor = eye[[traced[i]]] if i in traced else eye
+            bra = np.kron(bra, factor)
+        output_state += bra @ state @ bra.conj().T
+    return output_state
+
+
+def test_density_partial_trace():
+    # (num_systems, indices, truncation)
+    cases = [(3, (0, 2), 1), (3, (1,), 1), (4, (0, 2), 1), (4, (1, 3), 1), (4, (0, 1, 3), 1),
+             (3, (0, 2), 2), (4, (1, 3), 2)]
+
+    for num_systems, indices, truncation in cases:
+        dim = (truncation + 1) ** num_systems
+        state = random_density(dim)
+        state_tuple = tuple(map(tuple, state))
+
+        output_state = density_partial_trace(state_tuple, indices, num_systems, truncation)
+        desired = reference_partial_trace(state, indices, num_systems, truncation)
+        assert output_state.shape == desired.shape
+        assert np.allclose(output_state, desired)
+
+
+def test_density_partial_trace_unsorted():
+    state = tuple(map(tuple, random_density(8)))
+    with pytest.raises(AssertionError):
+        density_partial_trace(state, (2, 0), 3)
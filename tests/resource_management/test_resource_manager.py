@@ -1,5 +1,4 @@
 import math
-import numpy
 
 from sequence.components.memory import MemoryArray
 from sequence.components.bsm import SingleAtomBSM
@@ -9,8 +8,6 @@ from sequence.resource_management.rule_manager import Rule
 from sequence.message import Message
 from sequence.topology.node import Node
 
-numpy.random.seed(0)
-
 
 class FakeNode(Node):
     def __init__(self, name, tl):
@@ -34,16 +34,20 @@ args = parser.parse_args()
 p = multiprocessing.Process(target=start_server, args=(args.ip, args.port))
 p.start()
 
+# create worker processes once, so that trials only time the client requests
+pool = multiprocessing.Pool(NUM_CLIENTS)
+client_args = [(args.ip, args.port)] * NUM_CLIENTS
+
 times = []
 for _ in range(NUM_TRIALS):
     start = time.time()
-    pool = multiprocessing.Pool(NUM_CLIENTS, client_function, [args.ip, args.port])
-    pool.close()
-    pool.join()
+    pool.starmap(client_function, client_args, chunksize=1)
     end = time.time()
     print("\ttime:", end - start)
     times.append(end - start)
 
+pool.close()
+pool.join()
 p.kill()
 
 print("average time:", np.mean(times))